@@ -1,8 +1,8 @@
-from random import randint
-import re
+from random import randint, sample
+import sys
 
-# Global variable to keep track of scores
-scores = {"computer": 0, "player": 0}
+# Translation table used to hide ship cells when displaying the board
+_HIDE_SHIPS = bytes.maketrans(b"@", b".")
 
 
 class Board:
@@ -10,140 +10,185 @@ class Board:
 
     def __init__(self, board_size, num_ships, name, board_type):
         self.board_size = board_size
-        self.board = [
-            ["." for _ in range(board_size)]
-            for _ in range(board_size)
-        ]
+        # Flat byte buffer: cell (x, y) lives at index x * board_size + y
+        self.board = bytearray(b"." * (board_size * board_size))
 
         self.num_ships = num_ships
         self.name = name
+        self.score = 0  # Hits scored by this board's owner
         self.type = board_type  # "player" or "computer"
-        self.guesses = []  # List to track guesses
-        self.ships = []  # List to track ships
+        # Bitboards: bit x * board_size + y is set when the cell is used
+        self.guesses_bb = 0  # Cells guessed so far
+        self.ships_bb = 0  # Cells still holding a ship
+        self.ships_count = 0  # Number of ships still afloat
+        self.num_placed = 0  # Number of ships placed so far
+        # Flat indices not yet guessed, for O(1) computer guesses
+        self.unguessed = list(range(board_size * board_size))
+        # Rendered row caches; entries reset to None when the row changes
+        self._row_cache = [None] * board_size
+        self._hidden_row_cache = [None] * board_size
+        # Constants reused on every guess prompt
+        self._max_idx = board_size - 1
+        self._range_msg = (
+            "Invalid input. Please enter a number between 0 and "
+            f"{self._max_idx} for both row and column."
+        )
+
+    def _idx(self, x, y):
+        """Return the flat buffer index for cell (x, y)."""
+        return x * self.board_size + y
+
+    def _invalidate_row(self, x):
+        """Drop the cached renderings of row x after a cell changes."""
+        self._row_cache[x] = None
+        self._hidden_row_cache[x] = None
 
     def display(self, hide_ships=False):
         """Print the board. Optionally hide ships for the computer's board."""
-        for row in self.board:
-            row_display = [
-                "." if hide_ships and cell == "@" else cell for cell in row
-            ]
-            print(" ".join(row_display))
-        print()
+        size = self.board_size
+        cache = self._hidden_row_cache if hide_ships else self._row_cache
+        for r in range(size):
+            if cache[r] is None:
+                row = bytes(self.board[r * size:(r + 1) * size])
+                if hide_ships:
+                    row = row.translate(_HIDE_SHIPS)
+                cache[r] = " ".join(row.decode())
+        sys.stdout.write("\n".join(cache) + "\n\n")
 
     def process_guess(self, x, y):
         """Process a guess and return whether it's a hit, miss, or repeat."""
-        if (x, y) in self.guesses:
+        idx = self._idx(x, y)
+        bit = 1 << idx
+        if self.guesses_bb & bit:
             print("You cannot guess the same coordinates more than once")
             return "Repeat"
 
-        self.guesses.append((x, y))
+        self.guesses_bb |= bit
 
-        if (x, y) in self.ships:
-            self.board[x][y] = "X"  # Mark as hit
+        if self.ships_bb & bit:
+            self.ships_bb &= ~bit  # Sink the ship
+            self.ships_count -= 1
+            self.board[idx] = ord("X")  # Mark as hit
+            self._invalidate_row(x)
             return "Hit"
 
-        self.board[x][y] = "O"  # Mark as miss
+        self.board[idx] = ord("O")  # Mark as miss
+        self._invalidate_row(x)
         return "Miss"
 
     def add_ship(self, x, y):
         """Add a ship to the board at the specified coordinates."""
-        if len(self.ships) >= self.num_ships:
+        idx = self._idx(x, y)
+        bit = 1 << idx
+        if self.num_placed >= self.num_ships:
             raise ValueError("Cannot add more ships!")
-        if (x, y) in self.ships:
+        if self.ships_bb & bit:
             raise ValueError("Ship already placed at this location!")
 
-        self.ships.append((x, y))
+        self.ships_bb |= bit
+        self.ships_count += 1
+        self.num_placed += 1
         if self.type == "player":  # Display ships on player's board
-            self.board[x][y] = "@"
+            self.board[idx] = ord("@")
+            self._invalidate_row(x)
 
 
 # Helper functions
-def random_point(board_size):
-    """Return a random integer between 0 and board_size-1."""
-    return randint(0, board_size - 1)
+def _read_line(prompt):
+    """Prompt on stdout and read one line from stdin.
 
+    Skips the readline hook and implicit flush inside input();
+    raises EOFError at end of input, matching input()'s behaviour.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
-def valid_coordinates(x, y, board):
-    """Check if coordinates are valid and not already occupied."""
-    return (
-        0 <= x < board.board_size and
-        0 <= y < board.board_size and
-        (x, y) not in board.ships
-    )
+
+def _is_int_token(token):
+    """Cheaply check that token parses as an int, without raising."""
+    if token.startswith("-"):
+        token = token[1:]
+    return token.isdecimal()
 
 
 def populate_board(board):
     """Place ships randomly on the board."""
-    while len(board.ships) < board.num_ships:
-        x, y = random_point(board.board_size), random_point(board.board_size)
-        if valid_coordinates(x, y, board):
-            board.add_ship(x, y)
+    cells = sample(range(board.board_size * board.board_size),
+                   board.num_ships)
+    for cell in cells:
+        x, y = divmod(cell, board.board_size)
+        board.add_ship(x, y)
 
 
 def populate_board_player(board):
     """Allow the player to manually place ships on the board."""
     print(f"{board.name}, it's time to place your ships!")
-    while len(board.ships) < board.num_ships:
+    size = board.board_size
+    while board.num_placed < board.num_ships:
         while True:
-            try:
-                x, y = map(int, input(
-                    f"Enter coordinates for ship {len(board.ships) + 1} "
-                    "as 'row column' (e.g., 1 2): "
-                ).split())
-
-                if valid_coordinates(x, y, board):
-                    board.add_ship(x, y)
-                    print(f"Ship placed at ({x}, {y}).")
-                    board.display()
-                    break
-                else:
-                    print(
-                        "Invalid coordinates or location already occupied. "
-                        "Try again."
-                        )
-
-            except ValueError:
+            parts = _read_line(
+                f"Enter coordinates for ship {board.num_placed + 1} "
+                "as 'row column' (e.g., 1 2): "
+            ).split()
+
+            if len(parts) != 2 or not (
+                    _is_int_token(parts[0]) and _is_int_token(parts[1])):
                 print("Invalid input. Please enter two numbers "
                       "separated by a space."
                       )
+                continue
+
+            x, y = int(parts[0]), int(parts[1])
+            if (0 <= x < size and 0 <= y < size
+                    and not board.ships_bb & (1 << (x * size + y))):
+                board.add_ship(x, y)
+                print(f"Ship placed at ({x}, {y}).")
+                board.display()
+                break
+            print(
+                "Invalid coordinates or location already occupied. "
+                "Try again."
+                )
 
 
 def get_player_guess(board):
     """Get player's guess input."""
     while True:
-        try:
-            x, y = map(int, input(
-                "Enter your guess as 'row column' (e.g., 1 2): ").split())
-            if 0 <= x < board.board_size and 0 <= y < board.board_size:
-                return x, y
-            print(
-                "Invalid input. Please enter a number between 0 and "
-                f"{board.board_size - 1} for both row and column."
-            )
-        except ValueError:
+        parts = _read_line(
+            "Enter your guess as 'row column' (e.g., 1 2): ").split()
+        if len(parts) != 2 or not (
+                _is_int_token(parts[0]) and _is_int_token(parts[1])):
             print("Invalid input. Please enter two numbers "
                   "separated by a space.")
+            continue
+        x, y = int(parts[0]), int(parts[1])
+        if 0 <= x <= board._max_idx and 0 <= y <= board._max_idx:
+            return x, y
+        print(board._range_msg)
 
 
 def get_computer_guess(board):
-    """Generate a random guess for the computer."""
-    while True:
-        x, y = random_point(board.board_size), random_point(board.board_size)
-        if (x, y) not in board.guesses:
-            return x, y
-
+    """Generate a random guess for the computer.
 
-def take_turn(board, guess_func):
-    """Handle a single turn for either player or computer."""
-    x, y = guess_func(board)
-    return board.process_guess(x, y)
+    Picks from the board's pool of unguessed cells with a swap-remove,
+    so each guess is O(1) with no rejection retries.
+    """
+    i = randint(0, len(board.unguessed) - 1)
+    cell = board.unguessed[i]
+    board.unguessed[i] = board.unguessed[-1]
+    board.unguessed.pop()
+    return divmod(cell, board.board_size)
 
 
 def play_game(computer_board, player_board):
     """Alternate turns between player and computer until the game ends."""
     round_num = 0  # Track round number
 
-    while player_board.ships and computer_board.ships:
+    while player_board.ships_count and computer_board.ships_count:
         round_num += 1
         print(f"\nRound {round_num}")
         print("\nYour Board (with ships):")
@@ -155,8 +200,7 @@ def play_game(computer_board, player_board):
         print(f"\n{player_board.name}, it's your turn!")
         while True:
             player_x, player_y = get_player_guess(computer_board)
-            player_result = take_turn(
-                computer_board, lambda b: (player_x, player_y))
+            player_result = computer_board.process_guess(player_x, player_y)
 
             # Allow the game to proceed if the guess is valid
             if player_result != "Repeat":
@@ -164,45 +208,40 @@ def play_game(computer_board, player_board):
             print("Please try again with new coordinates.")
 
         if player_result == "Hit":
-            computer_board.ships.remove((player_x, player_y))
-            scores["player"] += 1  # Increment player score for a hit
+            player_board.score += 1  # Increment player score for a hit
 
         # Computer's turn
         computer_x, computer_y = get_computer_guess(player_board)
-        computer_result = take_turn(
-            player_board, lambda b: (computer_x, computer_y))
+        computer_result = player_board.process_guess(computer_x, computer_y)
 
         if computer_result == "Hit":
-            player_board.ships.remove((computer_x, computer_y))
-            scores["computer"] += 1  # Increment computer score for a hit
+            computer_board.score += 1  # Increment computer score for a hit
 
-        # Round Summary
-        print("\nSummary:")
-        print(f"Player guessed: ({player_x}, {player_y}) - {player_result}")
-        print(
+        # Round summary and scores, built once and written in one call
+        rule = "_" * 35
+        sys.stdout.write(
+            "\nSummary:\n"
+            f"Player guessed: ({player_x}, {player_y}) - {player_result}\n"
             f"Computer guessed: ({computer_x}, {computer_y}) - "
-            f"{computer_result}"
+            f"{computer_result}\n"
+            f"{rule}\n"
+            f"After round {round_num}, the scores are:\n"
+            f"{player_board.name}: {player_board.score} \t"
+            f"Computer: {computer_board.score}\n"
+            f"{rule}\n"
         )
 
-        print("_" * 35)
-
-        # Scores after each round
-        print(f"After round {round_num}, the scores are:")
-        print(f"{player_board.name}: {scores['player']} \t"
-              f"Computer: {scores['computer']}")
-        print("_" * 35)
-
         # Check for end of game
-        if not computer_board.ships:
+        if not computer_board.ships_count:
             print("You sank all the computer's ships! You win!")
             break
 
-        if not player_board.ships:
+        if not player_board.ships_count:
             print("The computer sank all your ships! You lose!")
             break
 
         # Prompt to continue or quit
-        choice = input(
+        choice = _read_line(
             "Enter any key to continue or 'n' to quit: ").strip().lower()
         if choice == 'n':
             print("You chose to quit the game. Thank you for playing!")
@@ -210,15 +249,15 @@ def play_game(computer_board, player_board):
 
     # Final scores
     print("\nFinal Scores:")
-    print(f"{player_board.name}: {scores['player']}, "
-          f"Computer: {scores['computer']}")
+    print(f"{player_board.name}: {player_board.score}, "
+          f"Computer: {computer_board.score}")
 
 
 def get_valid_input(prompt, min_value, max_value):
     """Get a valid integer input from the user within a specified range."""
     while True:
         try:
-            user_input = input(prompt).strip()
+            user_input = _read_line(prompt).strip()
             if not user_input:  # Check for empty input
                 print("Input cannot be empty. Please try again.")
                 continue
@@ -245,15 +284,13 @@ def is_valid_name(name):
     and contains only letters and numbers.
     """
 
-    if not name or not re.match(r"^[A-Za-z][A-Za-z0-9]*$", name):
-        return False
-    if (
-        len(name) < 1
-        or len(name) > 15
-    ):  # Changed from '>= 15' to '>' to ensure length is strictly ≤ 15
-
-        return False
-    return True
+    return (
+        bool(name)
+        and len(name) <= 15
+        and name.isascii()
+        and name.isalnum()
+        and name[0].isalpha()
+    )
 
 
 def new_game():
@@ -262,10 +299,6 @@ def new_game():
     num_ships = get_valid_input(
         "Enter the number of ships (1 to board size - 1): ", 1, board_size - 1)
 
-    # Reset scores for a new game
-    scores["computer"] = 0
-    scores["player"] = 0
-
     print("_" * 35)
     print()
     print("Welcome to ULTIMATE BATTLESHIPS!!")
@@ -275,7 +308,7 @@ def new_game():
 
     # Validate player name
     while True:
-        player_name = input("Please enter your name: ").strip()
+        player_name = _read_line("Please enter your name: ").strip()
         if is_valid_name(player_name):
             break
         print(